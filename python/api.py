@@ -2,9 +2,10 @@ import os
 import numpy as np
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+from gymnasium import spaces
 from stable_baselines3 import PPO
 
-from loba_rl.loba_env import CARD_TO_INT, DECK_SIZE
+from loba_rl.loba_env import CARD_TO_INT, DECK_SIZE, FLAT_OBS_SIZE, fill_flat_observation
 from loba_rl.card import Card
 
 # --- Initialize Flask App and Model ---
@@ -23,34 +24,46 @@ except FileNotFoundError:
     print(f"Error: Model not found at {model_path}")
     model = None
 
-# --- Helper Function ---
-def state_to_observation(state_json):
-    """Converts a JSON game state from the frontend into a NumPy observation."""
+# --- Helper Functions ---
+def json_to_card(card):
+    """Converts a JSON card from the frontend into a Card, or None if it is unknown."""
+    # The JS card suit is lowercase, Python is capitalized.
+    card_obj = Card(rank=card["rank"], suit=card["suit"].capitalize())
+    return card_obj if card_obj in CARD_TO_INT else None
+
+def state_to_observation(state_json, flat=False):
+    """
+    Converts a JSON game state from the frontend into a NumPy observation.
+    With flat=True, returns the float32 vector used by LobaEnv(flat_obs=True).
+    The frontend does not send card tracker state, so neither encoding fits
+    models trained with track_cards.
+    """
     player_hand = state_json.get('hand', [])
     discard_top_card = state_json.get('discard_top', None)
     table_melds = state_json.get('melds', [])
 
+    # Unknown cards are skipped, an unknown discard top counts as an empty pile
+    hand = [c for c in map(json_to_card, player_hand) if c is not None]
+    melds = [[c for c in map(json_to_card, meld.get('cards', [])) if c is not None]
+             for meld in table_melds]
+    discard_top = json_to_card(discard_top_card) if discard_top_card else None
+
+    if flat:
+        obs = np.zeros(FLAT_OBS_SIZE, dtype=np.float32)
+        fill_flat_observation(obs, hand, melds, discard_top, state_json.get('turn_phase'))
+        return obs
+
     # Create the observation dictionary
     hand_obs = np.zeros(DECK_SIZE, dtype=np.int8)
-    for card in player_hand:
-        # The JS card suit is lowercase, Python is capitalized.
-        card_obj = Card(rank=card["rank"], suit=card["suit"].capitalize())
-        card_int = CARD_TO_INT.get(card_obj, -1)
-        if card_int != -1:
-            hand_obs[card_int] = 1
-
-    discard_top_obs = 0
-    if discard_top_card:
-        card_obj = Card(rank=discard_top_card["rank"], suit=discard_top_card["suit"].capitalize())
-        discard_top_obs = CARD_TO_INT.get(card_obj, -1) + 1
+    for card in hand:
+        hand_obs[CARD_TO_INT[card]] = 1
+
+    discard_top_obs = CARD_TO_INT[discard_top] + 1 if discard_top is not None else 0
 
     melds_obs = np.zeros(DECK_SIZE, dtype=np.int8)
-    for meld in table_melds:
-        for card in meld.get('cards', []):
-            card_obj = Card(rank=card["rank"], suit=card["suit"].capitalize())
-            card_int = CARD_TO_INT.get(card_obj, -1)
-            if card_int != -1:
-                melds_obs[card_int] = 1
+    for meld in melds:
+        for card in meld:
+            melds_obs[CARD_TO_INT[card]] = 1
 
     turn_phase_obs = 0 if state_json.get('turn_phase') == 'draw' else 1
 
@@ -66,7 +79,19 @@ def get_move():
         return jsonify({"error": "Model not loaded"}), 500
 
     state_json = request.json
-    observation = state_to_observation(state_json)
+    # Models trained with LobaEnv(flat_obs=True) expect a single vector
+    flat = isinstance(model.observation_space, spaces.Box)
+    if flat and model.observation_space.shape[0] != FLAT_OBS_SIZE:
+        return jsonify({
+            "error": f"Model expects an observation of size {model.observation_space.shape[0]}, "
+                     f"but only {FLAT_OBS_SIZE} is supported (was it trained with track_cards?)"
+        }), 500
+    if not flat and "unseen" in model.observation_space.spaces:
+        return jsonify({
+            "error": "Model expects card tracker fields, which are not supported "
+                     "(was it trained with track_cards?)"
+        }), 500
+    observation = state_to_observation(state_json, flat=flat)
 
     # Get the action from the model
     action, _ = model.predict(observation, deterministic=True)
@@ -0,0 +1,80 @@
+import time
+import numpy as np
+import torch
+from stable_baselines3 import PPO
+
+from loba_rl.loba_env import LobaEnv
+
+NUM_STEPS = 5000
+BATCH_SIZE = 2048
+NUM_BATCHES = 50
+LEARN_TIMESTEPS = 4096
+
+def random_action(env, rng):
+    """Picks a random action that is allowed by the action masks."""
+    type_mask, card_mask = env.action_masks()
+    action_type = rng.choice(np.flatnonzero(type_mask))
+    card_choices = np.flatnonzero(card_mask)
+    card_idx = rng.choice(card_choices) if len(card_choices) else 0
+    return [action_type, card_idx]
+
+def time_env_steps(env):
+    """Returns the average time of env.step() in microseconds."""
+    rng = np.random.default_rng(0)
+    env.reset(seed=0)
+    elapsed = 0.0
+    for _ in range(NUM_STEPS):
+        action = random_action(env, rng)
+        start = time.perf_counter()
+        _, _, terminated, truncated, _ = env.step(action)
+        elapsed += time.perf_counter() - start
+        if terminated or truncated:
+            env.reset()
+    return elapsed / NUM_STEPS * 1e6
+
+def time_policy_batches(env, policy_name):
+    """Returns the average time in milliseconds of a PPO forward pass over a batch."""
+    model = PPO(policy_name, env, device="cpu")
+    space = env.observation_space
+    samples = [space.sample() for _ in range(BATCH_SIZE)]
+    if isinstance(samples[0], dict):
+        batch = {k: np.stack([s[k] for s in samples]) for k in samples[0]}
+    else:
+        batch = np.stack(samples)
+
+    start = time.perf_counter()
+    with torch.no_grad():
+        for _ in range(NUM_BATCHES):
+            obs_tensor, _ = model.policy.obs_to_tensor(batch)
+            model.policy.evaluate_actions(obs_tensor, torch.zeros((BATCH_SIZE, 2)))
+    return (time.perf_counter() - start) / NUM_BATCHES * 1e3
+
+def time_learn(env, policy_name):
+    """Returns PPO training throughput in env steps per second."""
+    model = PPO(policy_name, env, device="cpu", seed=0)
+    start = time.perf_counter()
+    model.learn(total_timesteps=LEARN_TIMESTEPS)
+    return LEARN_TIMESTEPS / (time.perf_counter() - start)
+
+def main():
+    """
+    Compares the Dict observation (MultiInputPolicy) with the flat one
+    (MlpPolicy): per env step, per training-sized batch and PPO learn throughput.
+    """
+    torch.set_num_threads(1)
+    for label, flat_obs, policy_name in [
+        ("dict", False, "MultiInputPolicy"),
+        ("flat", True, "MlpPolicy"),
+    ]:
+        env = LobaEnv(flat_obs=flat_obs)
+        step_us = time_env_steps(env)
+        batch_ms = time_policy_batches(env, policy_name)
+        learn_fps = time_learn(env, policy_name)
+        # Width of the policy input, after SB3 one-hot encodes the Discrete fields
+        input_dim = PPO(policy_name, env, device="cpu").policy.features_extractor.features_dim
+        print(f"{label}: policy input {input_dim:4d} | env.step {step_us:7.1f} us | "
+              f"batch of {BATCH_SIZE} {batch_ms:6.2f} ms | PPO learn {learn_fps:6.0f} steps/s")
+        env.close()
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,8 @@ def draw_from_deck(game: GameState):
             # All but the top card of the discard pile become the new deck
             new_deck = game.discard_pile[:-1]
             random.shuffle(new_deck)
+            if game.tracker:
+                game.tracker.reshuffle(new_deck)
             game.deck = new_deck
             game.discard_pile = [game.discard_pile[-1]] # Keep the top card
         else:
@@ -25,7 +27,10 @@ def draw_from_deck(game: GameState):
             return False
 
     player = game.current_player
-    player.hand.append(game.deck.pop())
+    card = game.deck.pop()
+    player.hand.append(card)
+    if game.tracker:
+        game.tracker.draw_from_deck(game.current_player_idx, card)
     game.turn_phase = 'play'
     return True
 
@@ -40,6 +45,8 @@ def discard_card(game: GameState, card_index: int):
 
     card_to_discard = player.hand.pop(card_index)
     game.discard_pile.append(card_to_discard)
+    if game.tracker:
+        game.tracker.reveal(game.current_player_idx, card_to_discard)
 
     # Check if the player won
     if not player.hand:
@@ -72,6 +79,9 @@ def meld_cards(game: GameState, card_indices: list[int]):
         # Remove cards from hand
         for index in sorted(card_indices, reverse=True):
             player.hand.pop(index)
+        if game.tracker:
+            for card in selected_cards:
+                game.tracker.reveal(game.current_player_idx, card)
 
         if not player.hand:
             game.end_round(winner=player)
@@ -96,6 +106,8 @@ def lay_off_card(game: GameState, card_index: int, meld_index: int):
         if not any(c.rank == 'Joker' for c in meld['cards']):
             meld['cards'].append(card_to_lay_off)
             player.hand.pop(card_index)
+            if game.tracker:
+                game.tracker.reveal(game.current_player_idx, card_to_lay_off)
             if not player.hand:
                 game.end_round(winner=player)
             return True
@@ -108,6 +120,8 @@ def lay_off_card(game: GameState, card_index: int, meld_index: int):
     if meld['type'] == 'escalera' and is_escalera(potential_new_meld):
         meld['cards'] = potential_new_meld # Assuming sort_escalera would be called
         player.hand.pop(card_index)
+        if game.tracker:
+            game.tracker.reveal(game.current_player_idx, card_to_lay_off)
         if not player.hand:
             game.end_round(winner=player)
         return True
@@ -21,3 +21,9 @@ class Card:
 # Define the Joker as a special instance or a separate class if it has unique behavior.
 # For now, we can represent it with a special rank and suit.
 JOKER = Card(rank="Joker", suit="Joker")
+
+# Create a unique ID for each card in a full Loba deck (108 cards)
+UNIQUE_CARDS = [Card(r, s) for _ in range(2) for s in SUITS for r in RANKS] + [JOKER] * 4
+CARD_TO_INT = {card: i for i, card in enumerate(UNIQUE_CARDS)}
+INT_TO_CARD = {i: card for i, card in enumerate(UNIQUE_CARDS)}
+DECK_SIZE = len(UNIQUE_CARDS)
@@ -2,6 +2,7 @@ from .deck import create_deck, shuffle_deck
 from .card import Card
 from typing import List, Optional
 from .constants import CARD_VALUES
+from .tracker import CardTracker
 
 class Player:
     def __init__(self, player_id: int):
@@ -15,7 +16,7 @@ class Player:
         return sum(CARD_VALUES.get(c.rank, 0) for c in self.hand)
 
 class GameState:
-    def __init__(self, num_players: int = 2):
+    def __init__(self, num_players: int = 2, track_cards: bool = False):
         if not 2 <= num_players <= 5:
             raise ValueError("Loba must be played with 2 to 5 players.")
 
@@ -36,6 +37,9 @@ class GameState:
         self.turn_phase = 'draw' # Can be 'draw' or 'play'
         self.winner: Optional[Player] = None
 
+        # Incrementally updated card knowledge, only kept when it is requested
+        self.tracker: Optional[CardTracker] = CardTracker(self) if track_cards else None
+
     @property
     def current_player(self) -> Player:
         return self.players[self.current_player_idx]
@@ -5,28 +5,68 @@ from itertools import combinations
 
 from .game_state import GameState
 from . import actions
-from .card import Card, SUITS, RANKS, JOKER
+from .card import Card, SUITS, RANKS, JOKER, UNIQUE_CARDS, CARD_TO_INT, INT_TO_CARD, DECK_SIZE
 from .constants import CARD_VALUES
 from .utils import find_all_melds
 
-# Create a unique ID for each card in a full Loba deck (108 cards)
-UNIQUE_CARDS = [Card(r, s) for _ in range(2) for s in SUITS for r in RANKS] + [JOKER] * 4
-CARD_TO_INT = {card: i for i, card in enumerate(UNIQUE_CARDS)}
-INT_TO_CARD = {i: card for i, card in enumerate(UNIQUE_CARDS)}
-DECK_SIZE = len(UNIQUE_CARDS)
-
 # Constants for the action space
 MAX_HAND_SIZE = 15 # A safe upper bound
 
+# Layout of the flat observation vector (flat_obs=True)
+FLAT_HAND = slice(0, DECK_SIZE)                              # 1 if the card id is in hand
+FLAT_MELDS = slice(DECK_SIZE, 2 * DECK_SIZE)                 # 1 if the card id is on the table
+FLAT_DISCARD_TOP = slice(2 * DECK_SIZE, 3 * DECK_SIZE + 1)   # One-hot, index 0 = empty pile
+FLAT_TURN_PHASE = 3 * DECK_SIZE + 1                          # 0 for draw, 1 for play
+FLAT_OBS_SIZE = 3 * DECK_SIZE + 2
+# With track_cards=True the tracker fields follow, in order: unseen (DECK_SIZE),
+# opponent_known ((num_players - 1) * DECK_SIZE), opponent_hand_sizes (num_players - 1)
+
+def fill_flat_observation(out, hand, melds, discard_top, turn_phase):
+    """
+    Writes the base observation into the first FLAT_OBS_SIZE entries of `out`
+    in place. `melds` is a list of card lists and `discard_top` may be None.
+    """
+    out[:FLAT_OBS_SIZE] = 0
+    for card in hand:
+        out[CARD_TO_INT[card]] = 1
+    for meld in melds:
+        for card in meld:
+            out[FLAT_MELDS.start + CARD_TO_INT[card]] = 1
+    discard_idx = CARD_TO_INT[discard_top] + 1 if discard_top is not None else 0
+    out[FLAT_DISCARD_TOP.start + discard_idx] = 1
+    out[FLAT_TURN_PHASE] = 0 if turn_phase == 'draw' else 1
+
+def env_kwargs_from_space(observation_space):
+    """
+    Returns the LobaEnv arguments (num_players, track_cards, flat_obs) that
+    produce the given observation space, e.g. the one of a loaded model.
+    """
+    if isinstance(observation_space, spaces.Box):
+        extra = observation_space.shape[0] - FLAT_OBS_SIZE
+        if extra == 0:
+            return {"flat_obs": True}
+        # Tracker fields take num_players * DECK_SIZE + (num_players - 1) entries
+        return {"flat_obs": True, "track_cards": True, "num_players": (extra + 1) // (DECK_SIZE + 1)}
+    if "unseen" in observation_space.spaces:
+        num_opponents = observation_space["opponent_hand_sizes"].shape[0]
+        return {"track_cards": True, "num_players": num_opponents + 1}
+    return {}
+
 class LobaEnv(gym.Env):
     """A Gymnasium environment for the Loba card game."""
 
     metadata = {'render_modes': ['human']}
 
-    def __init__(self, num_players=2):
+    def __init__(self, num_players=2, track_cards=False, flat_obs=False):
         super().__init__()
         self.num_players = num_players
-        self.game = GameState(num_players=self.num_players)
+        # If True, add the card tracker's fields (see tracker.py) to the observation
+        self.track_cards = track_cards
+        # If True, observations are a single float32 vector (see FLAT_* above)
+        # instead of a Dict. The vector is a preallocated buffer that is refilled
+        # in place and returned by every step, so copy it to keep it around.
+        self.flat_obs = flat_obs
+        self.game = GameState(num_players=self.num_players, track_cards=self.track_cards)
 
         # Define action and observation spaces
         # These must be gym.spaces objects
@@ -34,7 +74,7 @@ class LobaEnv(gym.Env):
         # Example: spaces.Box(low=0, high=1, shape=(3,), dtype=np.float32) for continuous actions
 
         # Observation Space
-        self.observation_space = spaces.Dict({
+        obs_spaces = {
             # Multi-binary representation of the player's hand
             "hand": spaces.MultiBinary(DECK_SIZE),
             # Top card of the discard pile (0 if empty)
@@ -43,7 +83,29 @@ class LobaEnv(gym.Env):
             "melds": spaces.MultiBinary(DECK_SIZE),
             # Whose turn it is
             "turn_phase": spaces.Discrete(2) # 0 for draw, 1 for play
-        })
+        }
+        if self.track_cards:
+            num_opponents = self.num_players - 1
+            # Per-card-id counts of cards the player has not seen yet
+            obs_spaces["unseen"] = spaces.Box(low=0, high=4, shape=(DECK_SIZE,), dtype=np.int8)
+            # Cards each opponent is known to hold (taken from the discard pile), in turn order.
+            # Always zero for now: there is no action for drawing from the discard pile yet.
+            obs_spaces["opponent_known"] = spaces.Box(low=0, high=4, shape=(num_opponents, DECK_SIZE), dtype=np.int8)
+            # Number of cards in each opponent's hand, in turn order
+            obs_spaces["opponent_hand_sizes"] = spaces.Box(low=0, high=DECK_SIZE, shape=(num_opponents,), dtype=np.int8)
+        self.observation_space = spaces.Dict(obs_spaces)
+
+        if self.flat_obs:
+            high = np.ones(FLAT_OBS_SIZE, dtype=np.float32)
+            if self.track_cards:
+                num_opponents = self.num_players - 1
+                high = np.concatenate([
+                    high,
+                    np.full(DECK_SIZE * (num_opponents + 1), 4, dtype=np.float32),
+                    np.full(num_opponents, DECK_SIZE, dtype=np.float32),
+                ])
+            self.observation_space = spaces.Box(low=0, high=high, dtype=np.float32)
+            self._flat_buffer = np.zeros(high.shape, dtype=np.float32)
 
         # Simplified Action Space
         self.action_space = spaces.MultiDiscrete([
@@ -52,6 +114,9 @@ class LobaEnv(gym.Env):
         ])
 
     def _get_obs(self):
+        if self.flat_obs:
+            return self._get_flat_obs()
+
         player = self.game.current_player
 
         hand_obs = np.zeros(DECK_SIZE, dtype=np.int8)
@@ -67,10 +132,33 @@ class LobaEnv(gym.Env):
 
         turn_phase_obs = 0 if self.game.turn_phase == 'draw' else 1
 
-        return {
+        obs = {
             "hand": hand_obs, "discard_top": discard_top_obs,
             "melds": melds_obs, "turn_phase": turn_phase_obs
         }
+        if self.track_cards:
+            obs.update(self.game.tracker.observation(self.game.current_player_idx))
+        return obs
+
+    def _get_flat_obs(self):
+        out = self._flat_buffer
+        discard_top = self.game.discard_pile[-1] if self.game.discard_pile else None
+        fill_flat_observation(
+            out, self.game.current_player.hand, [m['cards'] for m in self.game.melds],
+            discard_top, self.game.turn_phase
+        )
+        if self.track_cards:
+            tracker = self.game.tracker
+            idx = self.game.current_player_idx
+            opponents = [(idx + k) % self.num_players for k in range(1, self.num_players)]
+            pos = FLAT_OBS_SIZE
+            out[pos:pos + DECK_SIZE] = tracker.unseen[idx]
+            pos += DECK_SIZE
+            for opp in opponents:
+                out[pos:pos + DECK_SIZE] = tracker.known[opp]
+                pos += DECK_SIZE
+            out[pos:] = tracker.hand_sizes[opponents]
+        return out
 
     def _get_info(self):
         # Return auxiliary diagnostic information (helpful for debugging)
@@ -78,7 +166,11 @@ class LobaEnv(gym.Env):
 
     def reset(self, seed=None, options=None):
         super().reset(seed=seed)
-        self.game = GameState(num_players=self.num_players)
+        self.game = GameState(num_players=self.num_players, track_cards=self.track_cards)
+        if self.flat_obs:
+            # Fresh buffer, so a caller holding the terminal observation of
+            # the previous episode (e.g. a VecEnv) does not see it overwritten.
+            self._flat_buffer = np.zeros_like(self._flat_buffer)
         return self._get_obs(), {}
 
     def step(self, action):
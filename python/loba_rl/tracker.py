@@ -0,0 +1,79 @@
+import numpy as np
+from typing import List, Dict, TYPE_CHECKING
+
+from .card import Card, CARD_TO_INT, DECK_SIZE
+from .deck import create_deck
+
+if TYPE_CHECKING:
+    from .game_state import GameState
+
+class CardTracker:
+    """
+    Tracks what each player can infer about the cards they cannot see.
+
+    All counts are indexed by card id (see CARD_TO_INT), so duplicate cards
+    share an id and a count can go up to 2 (4 for the Joker). The tracker is
+    updated in place by the functions in actions.py, so reading it is O(1)
+    in the length of the game instead of replaying the history every step.
+    """
+
+    def __init__(self, game: "GameState"):
+        num_players = len(game.players)
+
+        self.total = np.zeros(DECK_SIZE, dtype=np.int8)
+        for card in create_deck():
+            self.total[CARD_TO_INT[card]] += 1
+
+        # unseen[p]: cards player p has not seen (deck + opponents' unknown cards)
+        self.unseen = np.tile(self.total, (num_players, 1))
+        # known[p]: cards everyone saw player p take from the discard pile.
+        # Stays zero until the engine has an action that calls take_discard.
+        self.known = np.zeros((num_players, DECK_SIZE), dtype=np.int8)
+        self.hand_sizes = np.zeros(num_players, dtype=np.int8)
+
+        for i, player in enumerate(game.players):
+            for card in player.hand:
+                self.unseen[i, CARD_TO_INT[card]] -= 1
+            self.hand_sizes[i] = len(player.hand)
+
+        for card in game.discard_pile:
+            self.unseen[:, CARD_TO_INT[card]] -= 1
+
+    def draw_from_deck(self, player_idx: int, card: Card) -> None:
+        """A player drew a face-down card: only they have now seen it."""
+        self.unseen[player_idx, CARD_TO_INT[card]] -= 1
+        self.hand_sizes[player_idx] += 1
+
+    def take_discard(self, player_idx: int, card: Card) -> None:
+        """A player took the (already public) top card of the discard pile."""
+        self.known[player_idx, CARD_TO_INT[card]] += 1
+        self.hand_sizes[player_idx] += 1
+
+    def reveal(self, player_idx: int, card: Card) -> None:
+        """A card left a player's hand face up (discarded, melded or laid off)."""
+        card_id = CARD_TO_INT[card]
+        if self.known[player_idx, card_id] > 0:
+            # Everyone already knew this card was in the player's hand.
+            self.known[player_idx, card_id] -= 1
+        else:
+            others = np.arange(len(self.hand_sizes)) != player_idx
+            self.unseen[others, card_id] -= 1
+        self.hand_sizes[player_idx] -= 1
+
+    def reshuffle(self, cards: List[Card]) -> None:
+        """Cards from the discard pile were shuffled back into the deck."""
+        for card in cards:
+            self.unseen[:, CARD_TO_INT[card]] += 1
+
+    def observation(self, player_idx: int) -> Dict[str, np.ndarray]:
+        """
+        Returns the tracker state from a player's point of view. Opponents are
+        ordered by turn order, starting with the next player.
+        """
+        num_players = len(self.hand_sizes)
+        opponents = [(player_idx + k) % num_players for k in range(1, num_players)]
+        return {
+            "unseen": self.unseen[player_idx].copy(),
+            "opponent_known": self.known[opponents],
+            "opponent_hand_sizes": self.hand_sizes[opponents],
+        }
@@ -1,5 +1,5 @@
 import os
-from loba_rl.loba_env import LobaEnv
+from loba_rl.loba_env import LobaEnv, env_kwargs_from_space
 from stable_baselines3 import PPO
 
 def main():
@@ -7,8 +7,6 @@ def main():
     This script loads a trained agent and has it play a game of Loba.
     You can specify which checkpoint to load, e.g., "ppo_loba_model_200000_steps.zip"
     """
-    env = LobaEnv()
-
     model_dir = "./rl_models/"
     # Load the latest model by default, or specify a checkpoint.
     # model_to_load = "ppo_loba_model_200000_steps.zip"
@@ -23,6 +21,9 @@ def main():
         print("Please run train.py to train and save a model first.")
         return
 
+    # Build the env with the settings the model was trained with
+    env = LobaEnv(**env_kwargs_from_space(model.observation_space))
+
     print(f"--- Starting Game with Agent: {model_to_load} ---")
     obs, info = env.reset()
 
@@ -14,7 +14,10 @@ def main():
     os.makedirs(log_dir, exist_ok=True)
     os.makedirs(model_dir, exist_ok=True)
 
-    env = LobaEnv()
+    # A flat observation vector lets PPO use MlpPolicy and skips the
+    # per-key preprocessing of MultiInputPolicy (see benchmark_obs.py).
+    flat_obs = False
+    env = LobaEnv(flat_obs=flat_obs)
 
     # Callback for saving models
     checkpoint_callback = CheckpointCallback(
@@ -25,7 +28,7 @@ def main():
 
     # Set up the model with a linearly decaying learning rate
     model = PPO(
-        "MultiInputPolicy",
+        "MlpPolicy" if flat_obs else "MultiInputPolicy",
         env,
         verbose=1,
         tensorboard_log=log_dir,